@@ -1,3 +1,4 @@
+import asyncio
 import dataclasses
 import datetime
 import logging
@@ -25,6 +26,24 @@ async def create_async_resource() -> typing.AsyncIterator[datetime.datetime]:
         logger.debug("Async resource destructed")
 
 
+@dataclasses.dataclass(slots=True)
+class Handshake:
+    """Pair of dependencies, waiting one finishes only when both are resolved concurrently."""
+
+    event: asyncio.Event = dataclasses.field(default_factory=asyncio.Event)
+
+    async def wait_for_event(self) -> bool:
+        return await self.event.wait()
+
+    async def set_event(self) -> bool:
+        self.event.set()
+        return True
+
+
+async def fail() -> bool:
+    raise ValueError
+
+
 @dataclasses.dataclass(kw_only=True, slots=True)
 class SimpleFactory:
     dep1: str
@@ -4,7 +4,6 @@ from dataclasses import dataclass, field
 import pytest
 
 from that_depends import providers
-from that_depends.providers.attr_getter import _get_value_from_object_by_dotted_path
 
 
 @dataclass
@@ -62,8 +61,12 @@ def test_nesting_levels(field_count: int, test_field_name: str, test_value: str
 
     setattr(obj_copy, test_field_name, test_value)
 
-    attr_value = _get_value_from_object_by_dotted_path(obj, attr_path)
-    assert attr_value == test_value
+    first_attr, *other_attrs = attr_path.split(".")
+    attr_getter = providers.AttrGetter(providers.Object(obj), first_attr)
+    for attr in other_attrs:
+        attr_getter = getattr(attr_getter, attr)
+
+    assert attr_getter.sync_resolve() == test_value
 
 
 def test_attr_getter_with_invalid_attribute(some_settings_provider: providers.Singleton[Settings]) -> None:
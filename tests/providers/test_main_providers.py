@@ -1,4 +1,8 @@
+import asyncio
 import datetime
+import typing
+import weakref
+from unittest import mock
 
 import pytest
 
@@ -51,3 +55,63 @@ async def test_free_dependency() -> None:
     dep2 = await DIContainer.resolve(container.FreeFactory)
     assert dep1
     assert dep2
+
+
+async def test_call_uses_patched_async_resolve() -> None:
+    provider = providers.Factory(int)
+
+    with mock.patch.object(providers.Factory, "async_resolve", mock.AsyncMock(return_value=42)):
+        assert await provider() == 42  # noqa: PLR2004
+
+    assert await provider() == 0
+
+
+def test_providers_support_weak_references() -> None:
+    provider = providers.Factory(int)
+
+    assert weakref.ref(provider)() is provider
+
+
+async def _create_resource(waited: bool, *, was_set: bool) -> typing.AsyncIterator[bool]:
+    yield waited and was_set
+
+
+async def test_resource_resolves_dependencies_concurrently() -> None:
+    handshake = container.Handshake()
+    resource = providers.Resource(
+        _create_resource,
+        providers.AsyncFactory(handshake.wait_for_event).cast,
+        was_set=providers.AsyncFactory(handshake.set_event).cast,
+    )
+
+    assert await asyncio.wait_for(resource.async_resolve(), timeout=1)
+    await resource.tear_down()
+
+
+async def test_resource_cancels_pending_dependencies_on_error() -> None:
+    resource = providers.Resource(
+        _create_resource,
+        providers.AsyncFactory(container.Handshake().wait_for_event).cast,
+        was_set=providers.AsyncFactory(container.fail).cast,
+    )
+
+    with pytest.raises(ValueError):  # noqa: PT011
+        await resource.async_resolve()
+
+    assert asyncio.all_tasks() == {asyncio.current_task()}
+
+
+def test_resource_resolving_in_different_event_loops() -> None:
+    async def create_resource() -> typing.AsyncIterator[str]:
+        await asyncio.sleep(0)
+        yield "resource"
+
+    resource = providers.Resource(create_resource)
+
+    async def resolve_concurrently() -> None:
+        first, second = await asyncio.gather(resource.async_resolve(), resource.async_resolve())
+        assert first == second == "resource"
+        await resource.tear_down()
+
+    asyncio.run(resolve_concurrently())
+    asyncio.run(resolve_concurrently())
@@ -1,26 +1,35 @@
 import datetime
+import typing
+from types import MappingProxyType
 
 import pytest
 
 from tests import container
 
 
-async def test_batch_providers_overriding() -> None:
-    async_resource_mock = datetime.datetime.fromisoformat("2023-01-01")
-    sync_resource_mock = datetime.datetime.fromisoformat("2024-01-01")
-    async_factory_mock = datetime.datetime.fromisoformat("2025-01-01")
-    simple_factory_mock = container.SimpleFactory(dep1="override", dep2=999)
-    singleton_mock = container.SingletonFactory(dep1=False)
+ASYNC_RESOURCE_MOCK: typing.Final = datetime.datetime.fromisoformat("2023-01-01")
+SYNC_RESOURCE_MOCK: typing.Final = datetime.datetime.fromisoformat("2024-01-01")
+ASYNC_FACTORY_MOCK: typing.Final = datetime.datetime.fromisoformat("2025-01-01")
 
-    providers_for_overriding = {
-        "async_resource": async_resource_mock,
-        "sync_resource": sync_resource_mock,
-        "simple_factory": simple_factory_mock,
-        "singleton": singleton_mock,
-        "async_factory": async_factory_mock,
-    }
 
-    with container.DIContainer.override_providers(providers_for_overriding):
+@pytest.fixture(scope="module")
+def override_mocks() -> typing.Mapping[str, typing.Any]:
+    return MappingProxyType(
+        {
+            "async_resource": ASYNC_RESOURCE_MOCK,
+            "sync_resource": SYNC_RESOURCE_MOCK,
+            "simple_factory": container.SimpleFactory(dep1="override", dep2=999),
+            "singleton": container.SingletonFactory(dep1=False),
+            "async_factory": ASYNC_FACTORY_MOCK,
+        }
+    )
+
+
+async def test_batch_providers_overriding(override_mocks: typing.Mapping[str, typing.Any]) -> None:
+    simple_factory_mock = override_mocks["simple_factory"]
+    singleton_mock = override_mocks["singleton"]
+
+    with container.DIContainer.override_providers(override_mocks):
         await container.DIContainer.simple_factory()
         dependent_factory = await container.DIContainer.dependent_factory()
         singleton = await container.DIContainer.singleton()
@@ -28,26 +37,18 @@ async def test_batch_providers_overriding() -> None:
 
     assert dependent_factory.simple_factory.dep1 == simple_factory_mock.dep1
     assert dependent_factory.simple_factory.dep2 == simple_factory_mock.dep2
-    assert dependent_factory.sync_resource == sync_resource_mock
-    assert dependent_factory.async_resource == async_resource_mock
+    assert dependent_factory.sync_resource == SYNC_RESOURCE_MOCK
+    assert dependent_factory.async_resource == ASYNC_RESOURCE_MOCK
     assert singleton is singleton_mock
-    assert async_factory is async_factory_mock
+    assert async_factory is ASYNC_FACTORY_MOCK
 
-    assert (await container.DIContainer.async_resource()) != async_resource_mock
+    assert (await container.DIContainer.async_resource()) != ASYNC_RESOURCE_MOCK
 
 
-async def test_batch_providers_overriding_sync_resolve() -> None:
-    async_resource_mock = datetime.datetime.fromisoformat("2023-01-01")
-    sync_resource_mock = datetime.datetime.fromisoformat("2024-01-01")
-    simple_factory_mock = container.SimpleFactory(dep1="override", dep2=999)
-    singleton_mock = container.SingletonFactory(dep1=False)
-
-    providers_for_overriding = {
-        "async_resource": async_resource_mock,
-        "sync_resource": sync_resource_mock,
-        "simple_factory": simple_factory_mock,
-        "singleton": singleton_mock,
-    }
+async def test_batch_providers_overriding_sync_resolve(override_mocks: typing.Mapping[str, typing.Any]) -> None:
+    simple_factory_mock = override_mocks["simple_factory"]
+    singleton_mock = override_mocks["singleton"]
+    providers_for_overriding = {k: v for k, v in override_mocks.items() if k != "async_factory"}
 
     with container.DIContainer.override_providers(providers_for_overriding):
         container.DIContainer.simple_factory.sync_resolve()
@@ -57,11 +58,27 @@ async def test_batch_providers_overriding_sync_resolve() -> None:
 
     assert dependent_factory.simple_factory.dep1 == simple_factory_mock.dep1
     assert dependent_factory.simple_factory.dep2 == simple_factory_mock.dep2
-    assert dependent_factory.sync_resource == sync_resource_mock
-    assert dependent_factory.async_resource == async_resource_mock
+    assert dependent_factory.sync_resource == SYNC_RESOURCE_MOCK
+    assert dependent_factory.async_resource == ASYNC_RESOURCE_MOCK
     assert singleton is singleton_mock
 
-    assert container.DIContainer.sync_resource.sync_resolve() != sync_resource_mock
+    assert container.DIContainer.sync_resource.sync_resolve() != SYNC_RESOURCE_MOCK
+
+
+def test_batch_providers_overriding_with_kwargs(override_mocks: typing.Mapping[str, typing.Any]) -> None:
+    simple_factory_mock = override_mocks["simple_factory"]
+
+    with container.DIContainer.override_providers(
+        {"sync_resource": SYNC_RESOURCE_MOCK}, simple_factory=simple_factory_mock
+    ):
+        assert container.DIContainer.simple_factory.sync_resolve() is simple_factory_mock
+        assert container.DIContainer.sync_resource.sync_resolve() is SYNC_RESOURCE_MOCK
+
+    with container.DIContainer.override_providers(simple_factory=simple_factory_mock):
+        assert container.DIContainer.simple_factory.sync_resolve() is simple_factory_mock
+
+    assert container.DIContainer.simple_factory.sync_resolve() is not simple_factory_mock
+    assert container.DIContainer.sync_resource.sync_resolve() is not SYNC_RESOURCE_MOCK
 
 
 def test_providers_overriding_with_context_manager() -> None:
@@ -73,6 +90,68 @@ def test_providers_overriding_with_context_manager() -> None:
     assert container.DIContainer.simple_factory.sync_resolve() is not simple_factory_mock
 
 
+def test_providers_overriding_with_context_decorator() -> None:
+    simple_factory_mock = container.SimpleFactory(dep1="override", dep2=999)
+
+    @container.DIContainer.simple_factory.override_context(simple_factory_mock)
+    def resolve_simple_factory() -> container.SimpleFactory:
+        return container.DIContainer.simple_factory.sync_resolve()
+
+    assert resolve_simple_factory() is simple_factory_mock
+    assert resolve_simple_factory() is simple_factory_mock
+    assert container.DIContainer.simple_factory.sync_resolve() is not simple_factory_mock
+
+
+def test_providers_overriding_with_recursive_context_decorator() -> None:
+    simple_factory_mock = container.SimpleFactory(dep1="override", dep2=999)
+
+    @container.DIContainer.simple_factory.override_context(simple_factory_mock)
+    def resolve_recursively(depth: int) -> container.SimpleFactory:
+        if depth:
+            return resolve_recursively(depth - 1)
+        return container.DIContainer.simple_factory.sync_resolve()
+
+    assert resolve_recursively(1) is simple_factory_mock
+    assert container.DIContainer.simple_factory.sync_resolve() is not simple_factory_mock
+
+
+def test_nested_providers_overriding_with_context_manager() -> None:
+    outer_mock = container.SimpleFactory(dep1="outer", dep2=1)
+    inner_mock = container.SimpleFactory(dep1="inner", dep2=2)
+
+    with container.DIContainer.simple_factory.override_context(outer_mock):
+        with container.DIContainer.simple_factory.override_context(inner_mock):
+            assert container.DIContainer.simple_factory.sync_resolve() is inner_mock
+
+        assert container.DIContainer.simple_factory.sync_resolve() is outer_mock
+
+    assert container.DIContainer.simple_factory.sync_resolve() is not outer_mock
+
+
+def test_providers_overriding_nested_in_context_manager() -> None:
+    outer_mock = container.SimpleFactory(dep1="outer", dep2=1)
+    inner_mock = container.SimpleFactory(dep1="inner", dep2=2)
+
+    with container.DIContainer.simple_factory.override_context(outer_mock):
+        with container.DIContainer.override_providers(simple_factory=inner_mock):
+            assert container.DIContainer.simple_factory.sync_resolve() is inner_mock
+
+        assert container.DIContainer.simple_factory.sync_resolve() is outer_mock
+
+    assert container.DIContainer.simple_factory.sync_resolve() is not outer_mock
+
+
+async def test_providers_overriding_with_falsy_mock() -> None:
+    with container.DIContainer.sync_resource.override_context(0):
+        assert container.DIContainer.sync_resource.sync_resolve() == 0
+        assert await container.DIContainer.sync_resource() == 0
+
+    empty_mock: typing.Any = []
+    with container.DIContainer.simple_factory.override_context(empty_mock):
+        assert container.DIContainer.simple_factory.sync_resolve() is empty_mock
+        assert await container.DIContainer.simple_factory() is empty_mock
+
+
 def test_providers_overriding_fail_with_unknown_provider() -> None:
     unknown_provider_name = "unknown_provider_name"
     match = f"Provider with name {unknown_provider_name!r} not found"
@@ -83,16 +162,13 @@ def test_providers_overriding_fail_with_unknown_provider() -> None:
 
 
 async def test_providers_overriding() -> None:
-    async_resource_mock = datetime.datetime.fromisoformat("2023-01-01")
-    sync_resource_mock = datetime.datetime.fromisoformat("2024-01-01")
-    async_factory_mock = datetime.datetime.fromisoformat("2025-01-01")
     simple_factory_mock = container.SimpleFactory(dep1="override", dep2=999)
     singleton_mock = container.SingletonFactory(dep1=False)
-    container.DIContainer.async_resource.override(async_resource_mock)
-    container.DIContainer.sync_resource.override(sync_resource_mock)
+    container.DIContainer.async_resource.override(ASYNC_RESOURCE_MOCK)
+    container.DIContainer.sync_resource.override(SYNC_RESOURCE_MOCK)
     container.DIContainer.simple_factory.override(simple_factory_mock)
     container.DIContainer.singleton.override(singleton_mock)
-    container.DIContainer.async_factory.override(async_factory_mock)
+    container.DIContainer.async_factory.override(ASYNC_FACTORY_MOCK)
 
     await container.DIContainer.simple_factory()
     dependent_factory = await container.DIContainer.dependent_factory()
@@ -101,22 +177,20 @@ async def test_providers_overriding() -> None:
 
     assert dependent_factory.simple_factory.dep1 == simple_factory_mock.dep1
     assert dependent_factory.simple_factory.dep2 == simple_factory_mock.dep2
-    assert dependent_factory.sync_resource == sync_resource_mock
-    assert dependent_factory.async_resource == async_resource_mock
+    assert dependent_factory.sync_resource == SYNC_RESOURCE_MOCK
+    assert dependent_factory.async_resource == ASYNC_RESOURCE_MOCK
     assert singleton is singleton_mock
-    assert async_factory is async_factory_mock
+    assert async_factory is ASYNC_FACTORY_MOCK
 
     container.DIContainer.reset_override()
-    assert (await container.DIContainer.async_resource()) != async_resource_mock
+    assert (await container.DIContainer.async_resource()) != ASYNC_RESOURCE_MOCK
 
 
 async def test_providers_overriding_sync_resolve() -> None:
-    async_resource_mock = datetime.datetime.fromisoformat("2023-01-01")
-    sync_resource_mock = datetime.datetime.fromisoformat("2024-01-01")
     simple_factory_mock = container.SimpleFactory(dep1="override", dep2=999)
     singleton_mock = container.SingletonFactory(dep1=False)
-    container.DIContainer.async_resource.override(async_resource_mock)
-    container.DIContainer.sync_resource.override(sync_resource_mock)
+    container.DIContainer.async_resource.override(ASYNC_RESOURCE_MOCK)
+    container.DIContainer.sync_resource.override(SYNC_RESOURCE_MOCK)
     container.DIContainer.simple_factory.override(simple_factory_mock)
     container.DIContainer.singleton.override(singleton_mock)
 
@@ -127,9 +201,9 @@ async def test_providers_overriding_sync_resolve() -> None:
 
     assert dependent_factory.simple_factory.dep1 == simple_factory_mock.dep1
     assert dependent_factory.simple_factory.dep2 == simple_factory_mock.dep2
-    assert dependent_factory.sync_resource == sync_resource_mock
-    assert dependent_factory.async_resource == async_resource_mock
+    assert dependent_factory.sync_resource == SYNC_RESOURCE_MOCK
+    assert dependent_factory.async_resource == ASYNC_RESOURCE_MOCK
     assert singleton is singleton_mock
 
     container.DIContainer.reset_override()
-    assert container.DIContainer.sync_resource.sync_resolve() != sync_resource_mock
+    assert container.DIContainer.sync_resource.sync_resolve() != SYNC_RESOURCE_MOCK
@@ -1,3 +1,4 @@
+import asyncio
 import dataclasses
 
 import pydantic
@@ -39,3 +40,19 @@ async def test_singleton_attr_getter() -> None:
     assert singleton1.dep1 == Settings().some_setting
 
     await DIContainer.tear_down()
+
+
+def test_singleton_resolving_in_different_event_loops() -> None:
+    async def create_dependency() -> str:
+        await asyncio.sleep(0)
+        return "dependency"
+
+    singleton = providers.Singleton(SingletonFactory, dep1=providers.AsyncFactory(create_dependency).cast)
+
+    async def resolve_concurrently() -> None:
+        first, second = await asyncio.gather(singleton.async_resolve(), singleton.async_resolve())
+        assert first is second
+        await singleton.tear_down()
+
+    asyncio.run(resolve_concurrently())
+    asyncio.run(resolve_concurrently())
@@ -1,11 +1,13 @@
 import asyncio
 import datetime
-import warnings
+import functools
+import inspect
+import typing
 
 import pytest
 
 from tests import container
-from that_depends import Provide, inject
+from that_depends import BaseContainer, Provide, inject, providers
 
 
 @pytest.fixture(name="fixture_one")
@@ -42,15 +44,52 @@ async def test_injection_with_overriding() -> None:
     await inner(True, arg2=container.SimpleFactory(dep1="1", dep2=2))
 
 
-async def test_empty_injection() -> None:
+async def test_injection_resolves_dependencies_concurrently() -> None:
+    handshake = container.Handshake()
+
+    class DIContainer(BaseContainer):
+        waiting_factory = providers.AsyncFactory(handshake.wait_for_event)
+        setting_factory = providers.AsyncFactory(handshake.set_event)
+
     @inject
+    async def inner(
+        waited: bool = Provide[DIContainer.waiting_factory],
+        was_set: bool = Provide[DIContainer.setting_factory],
+    ) -> bool:
+        return waited and was_set
+
+    assert await asyncio.wait_for(inner(), timeout=1)
+
+
+async def test_injection_cancels_pending_dependencies_on_error() -> None:
+    class DIContainer(BaseContainer):
+        waiting_factory = providers.AsyncFactory(container.Handshake().wait_for_event)
+        failing_factory = providers.AsyncFactory(container.fail)
+
+    @inject
+    async def inner(
+        _: bool = Provide[DIContainer.waiting_factory],
+        __: bool = Provide[DIContainer.failing_factory],
+    ) -> None:
+        """Do nothing."""
+
+    with pytest.raises(ValueError):  # noqa: PT011
+        await inner()
+
+    assert asyncio.all_tasks() == {asyncio.current_task()}
+
+
+async def test_empty_injection() -> None:
     async def inner(_: int) -> None:
         """Do nothing."""
 
-    warnings.filterwarnings("error")
+    with pytest.warns(
+        RuntimeWarning, match="Expected injection, but nothing found. Remove @inject decorator."
+    ) as warning_records:
+        injected = inject(inner)
 
-    with pytest.raises(RuntimeWarning, match="Expected injection, but nothing found. Remove @inject decorator."):
-        await inner(1)
+    assert injected is inner
+    assert warning_records[0].filename == __file__
 
 
 @inject
@@ -75,15 +114,90 @@ def test_wrong_sync_injection() -> None:
         inner(_=container.SimpleFactory(dep1="1", dep2=2))
 
 
-def test_sync_empty_injection() -> None:
+def test_async_provider_in_sync_injection() -> None:
+    with pytest.raises(
+        RuntimeError,
+        match="Async provider cannot be injected into sync function "
+        "test_async_provider_in_sync_injection.<locals>.inner, field_name='_'",
+    ):
+
+        @inject
+        def inner(
+            _: datetime.datetime = Provide[container.DIContainer.async_factory],
+        ) -> None:
+            """Do nothing."""
+
+
+def test_sync_injection_with_positional_argument() -> None:
+    simple_factory_mock = container.SimpleFactory(dep1="1", dep2=2)
+
+    @inject
+    def inner(
+        simple_factory: container.SimpleFactory = Provide[container.DIContainer.simple_factory],
+    ) -> container.SimpleFactory:
+        return simple_factory
+
+    assert inner(simple_factory_mock) is simple_factory_mock
+    assert inner() is not simple_factory_mock
+
+
+async def test_injection_of_keyword_only_arguments() -> None:
     @inject
+    async def inner(
+        *args: int,
+        simple_factory: container.SimpleFactory = Provide[container.DIContainer.simple_factory],
+    ) -> container.SimpleFactory:
+        assert args == (1, 2)
+        return simple_factory
+
+    @inject
+    def sync_inner(
+        *args: int,
+        simple_factory: container.SimpleFactory = Provide[container.DIContainer.simple_factory],
+    ) -> container.SimpleFactory:
+        assert args == (1, 2)
+        return simple_factory
+
+    assert isinstance(await inner(1, 2), container.SimpleFactory)
+    assert isinstance(sync_inner(1, 2), container.SimpleFactory)
+
+
+def test_injection_of_wrapped_function() -> None:
+    def func(
+        simple_factory: container.SimpleFactory = Provide[container.DIContainer.simple_factory],
+    ) -> container.SimpleFactory:
+        return simple_factory
+
+    @functools.wraps(func)
+    def wrapper(*args: typing.Any, **kwargs: typing.Any) -> container.SimpleFactory:  # noqa: ANN401
+        return func(*args, **kwargs)
+
+    assert isinstance(inject(wrapper)(), container.SimpleFactory)
+
+
+def test_injected_function_signature() -> None:
+    def func(
+        simple_factory: container.SimpleFactory = Provide[container.DIContainer.simple_factory],
+    ) -> container.SimpleFactory:
+        return simple_factory
+
+    signature = inspect.signature(func)
+    func.__signature__ = signature  # type: ignore[attr-defined]
+
+    assert inject(func).__signature__ is signature  # type: ignore[attr-defined]
+
+
+def test_sync_empty_injection() -> None:
     def inner(_: int) -> None:
         """Do nothing."""
 
-    warnings.filterwarnings("error")
+    with pytest.warns(
+        RuntimeWarning, match="Expected injection, but nothing found. Remove @inject decorator."
+    ) as warning_records:
+        injected = inject(inner)
 
-    with pytest.raises(RuntimeWarning, match="Expected injection, but nothing found. Remove @inject decorator."):
-        inner(1)
+    assert injected is inner
+    assert warning_records[0].filename == __file__
 
 
 def test_type_check() -> None:
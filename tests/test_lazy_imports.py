@@ -0,0 +1,50 @@
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+import that_depends
+from that_depends import providers
+from that_depends.providers import context_resources, selector
+
+
+def test_lazy_imports() -> None:
+    assert that_depends.container_context is context_resources.container_context
+    assert that_depends.fetch_context_item is context_resources.fetch_context_item
+
+
+def test_unknown_attribute() -> None:
+    with pytest.raises(AttributeError, match="module 'that_depends' has no attribute 'unknown'"):
+        that_depends.unknown  # noqa: B018
+
+
+def test_lazy_provider_imports() -> None:
+    assert providers.ContextResource is context_resources.ContextResource
+    assert providers.Selector is selector.Selector
+
+
+def test_unknown_provider_attribute() -> None:
+    with pytest.raises(AttributeError, match="module 'that_depends.providers' has no attribute 'unknown'"):
+        providers.unknown  # noqa: B018
+
+
+def test_lazy_imports_are_listed_by_dir() -> None:
+    assert {"container_context", "fetch_context_item", "BaseContainer"} <= set(dir(that_depends))
+    assert {"Selector", "ContextResource", "Factory"} <= set(dir(providers))
+
+
+def test_context_resources_are_imported_on_access() -> None:
+    code = textwrap.dedent(
+        """
+        import sys
+
+        import that_depends
+
+        assert "that_depends.providers.context_resources" not in sys.modules
+        that_depends.container_context
+        assert "that_depends.providers.context_resources" in sys.modules
+        """
+    )
+
+    subprocess.run([sys.executable, "-c", code], check=True)  # noqa: S603
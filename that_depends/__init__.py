@@ -1,8 +1,23 @@
+import typing
+
 from that_depends import providers
+from that_depends._lazy_imports import lazy_module_attributes
 from that_depends.container import BaseContainer
 from that_depends.injection import Provide, inject
-from that_depends.providers import container_context
-from that_depends.providers.context_resources import fetch_context_item
+
+
+if typing.TYPE_CHECKING:
+    from that_depends.providers.context_resources import container_context, fetch_context_item
+
+
+__getattr__, __dir__ = lazy_module_attributes(
+    __name__,
+    globals(),
+    {
+        "container_context": "that_depends.providers.context_resources",
+        "fetch_context_item": "that_depends.providers.context_resources",
+    },
+)
 
 
 __all__ = [
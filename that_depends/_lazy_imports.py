@@ -0,0 +1,27 @@
+import importlib
+import typing
+
+
+def lazy_module_attributes(
+    module_name: str, module_globals: dict[str, typing.Any], lazy_imports: typing.Mapping[str, str]
+) -> tuple[typing.Callable[[str], typing.Any], typing.Callable[[], list[str]]]:
+    """Create module level ``__getattr__`` and ``__dir__``, which import the given attributes on first access.
+
+    :param module_name: Name of the module, used in the error for unknown attributes.
+    :param module_globals: Globals of the module, imported attributes are cached there.
+    :param lazy_imports: Mapping of attribute names to the modules they are imported from.
+    """
+
+    def module_getattr(name: str) -> typing.Any:  # noqa: ANN401
+        if name in lazy_imports:
+            value = getattr(importlib.import_module(lazy_imports[name]), name)
+            module_globals[name] = value
+            return value
+
+        msg = f"module {module_name!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+
+    def module_dir() -> list[str]:
+        return sorted({*module_globals, *lazy_imports})
+
+    return module_getattr, module_dir
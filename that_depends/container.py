@@ -1,7 +1,8 @@
 import inspect
 import typing
 import warnings
-from contextlib import contextmanager
+from contextlib import ExitStack, contextmanager
+from types import MappingProxyType
 
 from that_depends.providers import AbstractProvider, Resource, Singleton
 
@@ -15,7 +16,7 @@ P = typing.ParamSpec("P")
 
 
 class BaseContainer:
-    providers: dict[str, AbstractProvider[typing.Any]]
+    providers: MappingProxyType[str, AbstractProvider[typing.Any]]
     containers: list[type["BaseContainer"]]
 
     def __new__(cls, *_: typing.Any, **__: typing.Any) -> "typing_extensions.Self":  # noqa: ANN401
@@ -35,9 +36,9 @@ class BaseContainer:
         cls.containers.extend(containers)
 
     @classmethod
-    def get_providers(cls) -> dict[str, AbstractProvider[typing.Any]]:
+    def get_providers(cls) -> MappingProxyType[str, AbstractProvider[typing.Any]]:
         if not hasattr(cls, "providers"):
-            cls.providers = {k: v for k, v in cls.__dict__.items() if isinstance(v, AbstractProvider)}
+            cls.providers = MappingProxyType({k: v for k, v in cls.__dict__.items() if isinstance(v, AbstractProvider)})
 
         return cls.providers
 
@@ -102,23 +103,27 @@ class BaseContainer:
 
     @classmethod
     @contextmanager
-    def override_providers(cls, providers_for_overriding: dict[str, typing.Any]) -> typing.Iterator[None]:
+    def override_providers(
+        cls,
+        providers_for_overriding: typing.Mapping[str, typing.Any] | None = None,
+        **kwargs: typing.Any,  # noqa: ANN401
+    ) -> typing.Iterator[None]:
+        """Override providers while inside the context.
+
+        Mocks can be passed as a mapping, as keyword arguments or both, keyword arguments win.
+        """
+        mocks: typing.Final = {**providers_for_overriding, **kwargs} if providers_for_overriding else kwargs
         current_providers: typing.Final = cls.get_providers()
         current_provider_names: typing.Final = set(current_providers.keys())
-        given_provider_names: typing.Final = set(providers_for_overriding.keys())
+        given_provider_names: typing.Final = set(mocks.keys())
 
         for given_name in given_provider_names:
             if given_name not in current_provider_names:
                 msg = f"Provider with name {given_name!r} not found"
                 raise RuntimeError(msg)
 
-        for provider_name, mock in providers_for_overriding.items():
-            provider = current_providers[provider_name]
-            provider.override(mock)
-
-        try:
+        # override contexts restore mocks of enclosing overrides on exit
+        with ExitStack() as stack:
+            for provider_name, mock in mocks.items():
+                stack.enter_context(current_providers[provider_name].override_context(mock))
             yield
-        finally:
-            for provider_name in providers_for_overriding:
-                provider = current_providers[provider_name]
-                provider.reset_override()
@@ -1,78 +1,125 @@
 import functools
 import inspect
+import sys
 import typing
 import warnings
 
-from that_depends.providers import AbstractProvider
+from that_depends.providers.base import AbstractProvider, resolve_concurrently
 
 
 P = typing.ParamSpec("P")
 T = typing.TypeVar("T")
+Injections = tuple[tuple[int, str, AbstractProvider[typing.Any]], ...]
+_POSITIONAL_KINDS: typing.Final = (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+# keyword-only parameters can never be filled by positional arguments
+_KEYWORD_ONLY_INDEX: typing.Final = sys.maxsize
 
 
 def inject(
     func: typing.Callable[P, T],
 ) -> typing.Callable[P, T]:
+    signature: typing.Final = _get_signature(func)
+    injections: typing.Final = _collect_injections(signature) if signature else ()
+    if not signature or not injections:
+        warnings.warn("Expected injection, but nothing found. Remove @inject decorator.", RuntimeWarning, stacklevel=2)
+        return func
+
     if inspect.iscoroutinefunction(func):
-        return typing.cast(typing.Callable[P, T], _inject_to_async(func))
+        return typing.cast(typing.Callable[P, T], _inject_to_async(func, signature, injections))
+
+    return _inject_to_sync(func, signature, injections)
+
+
+def _get_signature(func: typing.Callable[..., typing.Any]) -> inspect.Signature | None:
+    # plain function without defaults has nothing to inject, signature is not needed
+    if (
+        inspect.isfunction(func)
+        and not func.__defaults__
+        and not func.__kwdefaults__
+        and not hasattr(func, "__wrapped__")
+        and not hasattr(func, "__signature__")
+    ):
+        return None
+
+    return getattr(func, "__signature__", None) or inspect.signature(func)
+
 
-    return _inject_to_sync(func)
+def _collect_injections(signature: inspect.Signature) -> Injections:
+    return tuple(
+        (
+            i if field_value.kind in _POSITIONAL_KINDS else _KEYWORD_ONLY_INDEX,
+            field_name,
+            field_value.default,
+        )
+        for i, (field_name, field_value) in enumerate(signature.parameters.items())
+        if isinstance(field_value.default, AbstractProvider)
+    )
 
 
 def _inject_to_async(
     func: typing.Callable[P, typing.Coroutine[typing.Any, typing.Any, T]],
+    signature: inspect.Signature,
+    injections: Injections,
 ) -> typing.Callable[P, typing.Coroutine[typing.Any, typing.Any, T]]:
-    signature = inspect.signature(func)
+    resolvers: typing.Final = tuple(
+        (i, field_name, provider.async_resolve, provider.is_async) for i, field_name, provider in injections
+    )
 
     @functools.wraps(func)
     async def inner(*args: P.args, **kwargs: P.kwargs) -> T:
-        injected = False
-        for i, (field_name, field_value) in enumerate(signature.parameters.items()):
-            if i < len(args):
+        args_count = len(args)
+        async_field_names: list[str] = []
+        async_resolvers: list[typing.Callable[[], typing.Coroutine[typing.Any, typing.Any, typing.Any]]] = []
+        for i, field_name, resolve, is_async in resolvers:
+            if i < args_count or field_name in kwargs:
                 continue
 
-            if not isinstance(field_value.default, AbstractProvider):
-                continue
+            if is_async:
+                async_field_names.append(field_name)
+                async_resolvers.append(resolve)
+            else:
+                kwargs[field_name] = await resolve()
 
-            if field_name in kwargs:
-                continue
+        # only async providers are worth a task, they are resolved concurrently
+        if async_resolvers:
+            values = await resolve_concurrently([resolve() for resolve in async_resolvers])
+            kwargs.update(zip(async_field_names, values, strict=True))
 
-            kwargs[field_name] = await field_value.default()
-            injected = True
-        if not injected:
-            warnings.warn(
-                "Expected injection, but nothing found. Remove @inject decorator.", RuntimeWarning, stacklevel=1
-            )
         return await func(*args, **kwargs)
 
+    inner.__signature__ = signature  # type: ignore[attr-defined]
     return inner
 
 
 def _inject_to_sync(
     func: typing.Callable[P, T],
+    signature: inspect.Signature,
+    injections: Injections,
 ) -> typing.Callable[P, T]:
-    signature: typing.Final = inspect.signature(func)
+    for _, field_name, provider in injections:
+        if provider.is_async:
+            func_name = getattr(func, "__qualname__", func)
+            msg = f"Async provider cannot be injected into sync function {func_name}, {field_name=}"
+            raise RuntimeError(msg)
+
+    resolvers: typing.Final = tuple((i, field_name, provider.sync_resolve) for i, field_name, provider in injections)
 
     @functools.wraps(func)
     def inner(*args: P.args, **kwargs: P.kwargs) -> T:
-        injected = False
-        for field_name, field_value in signature.parameters.items():
-            if not isinstance(field_value.default, AbstractProvider):
+        args_count = len(args)
+        for i, field_name, resolve in resolvers:
+            if i < args_count:
                 continue
+
             if field_name in kwargs:
                 msg = f"Injected arguments must not be redefined, {field_name=}"
                 raise RuntimeError(msg)
 
-            kwargs[field_name] = field_value.default.sync_resolve()
-            injected = True
-
-        if not injected:
-            warnings.warn(
-                "Expected injection, but nothing found. Remove @inject decorator.", RuntimeWarning, stacklevel=1
-            )
+            kwargs[field_name] = resolve()
 
         return func(*args, **kwargs)
 
+    inner.__signature__ = signature  # type: ignore[attr-defined]
     return inner
 
 
@@ -1,19 +1,40 @@
+import typing
+
+from that_depends._lazy_imports import lazy_module_attributes
 from that_depends.providers.attr_getter import AttrGetter
 from that_depends.providers.base import AbstractProvider
-from that_depends.providers.collections import Dict, List
-from that_depends.providers.context_resources import (
-    AsyncContextResource,
-    ContextResource,
-    DIContextMiddleware,
-    container_context,
-)
 from that_depends.providers.factories import AsyncFactory, Factory
 from that_depends.providers.object import Object
 from that_depends.providers.resources import AsyncResource, Resource
-from that_depends.providers.selector import Selector
 from that_depends.providers.singleton import Singleton
 
 
+if typing.TYPE_CHECKING:
+    from that_depends.providers.collections import Dict, List
+    from that_depends.providers.context_resources import (
+        AsyncContextResource,
+        ContextResource,
+        DIContextMiddleware,
+        container_context,
+    )
+    from that_depends.providers.selector import Selector
+
+
+__getattr__, __dir__ = lazy_module_attributes(
+    __name__,
+    globals(),
+    {
+        "AsyncContextResource": "that_depends.providers.context_resources",
+        "ContextResource": "that_depends.providers.context_resources",
+        "DIContextMiddleware": "that_depends.providers.context_resources",
+        "container_context": "that_depends.providers.context_resources",
+        "Dict": "that_depends.providers.collections",
+        "List": "that_depends.providers.collections",
+        "Selector": "that_depends.providers.selector",
+    },
+)
+
+
 __all__ = [
     "AbstractProvider",
     "AsyncContextResource",
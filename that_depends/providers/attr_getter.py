@@ -8,34 +8,27 @@ T_co = typing.TypeVar("T_co", covariant=True)
 P = typing.ParamSpec("P")
 
 
-def _get_value_from_object_by_dotted_path(obj: typing.Any, path: str) -> typing.Any:  # noqa: ANN401
-    attribute_getter = attrgetter(path)
-    return attribute_getter(obj)
-
-
 class AttrGetter(
     AbstractProvider[T_co],
 ):
-    __slots__ = "_provider", "_attrs"
+    __slots__ = "_provider", "_attrs", "_getter"
 
     def __init__(self, provider: AbstractProvider[T_co], attr_name: str) -> None:
         super().__init__()
         self._provider = provider
         self._attrs = [attr_name]
+        self._getter = attrgetter(attr_name)
 
     def __getattr__(self, attr: str) -> "AttrGetter[T_co]":
-        if attr.startswith("_"):
+        if attr[:1] == "_":
             msg = f"'{type(self)}' object has no attribute '{attr}'"
             raise AttributeError(msg)
         self._attrs.append(attr)
+        self._getter = attrgetter(".".join(self._attrs))
         return self
 
     async def async_resolve(self) -> typing.Any:  # noqa: ANN401
-        resolved_provider_object = await self._provider.async_resolve()
-        attribute_path = ".".join(self._attrs)
-        return _get_value_from_object_by_dotted_path(resolved_provider_object, attribute_path)
+        return self._getter(await self._provider.async_resolve())
 
     def sync_resolve(self) -> typing.Any:  # noqa: ANN401
-        resolved_provider_object = self._provider.sync_resolve()
-        attribute_path = ".".join(self._attrs)
-        return _get_value_from_object_by_dotted_path(resolved_provider_object, attribute_path)
+        return self._getter(self._provider.sync_resolve())
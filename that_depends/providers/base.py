@@ -1,19 +1,28 @@
 import abc
 import asyncio
 import contextlib
+import functools
 import inspect
 import typing
-from contextlib import contextmanager
+import weakref
+from types import TracebackType
 
 
 T_co = typing.TypeVar("T_co", covariant=True)
 R = typing.TypeVar("R")
 P = typing.ParamSpec("P")
+ContextStack: typing.TypeAlias = (
+    contextlib.AbstractAsyncContextManager[typing.Any] | contextlib.AbstractContextManager[typing.Any]
+)
 
 
 class AbstractProvider(typing.Generic[T_co], abc.ABC):
     """Abstract Provider Class."""
 
+    __slots__ = "_override", "__weakref__"
+    # providers that can only be resolved asynchronously
+    is_async: typing.ClassVar[bool] = False
+
     def __init__(self) -> None:
         super().__init__()
         self._override: typing.Any = None
@@ -32,13 +41,8 @@ class AbstractProvider(typing.Generic[T_co], abc.ABC):
     def override(self, mock: object) -> None:
         self._override = mock
 
-    @contextmanager
-    def override_context(self, mock: object) -> typing.Iterator[None]:
-        self.override(mock)
-        try:
-            yield
-        finally:
-            self.reset_override()
+    def override_context(self, mock: object) -> "_OverrideContext":
+        return _OverrideContext(self, mock)
 
     def reset_override(self) -> None:
         self._override = None
@@ -62,8 +66,151 @@ class AbstractProvider(typing.Generic[T_co], abc.ABC):
         return typing.cast(T_co, self)
 
 
+async def resolve_concurrently(
+    coroutines: typing.Sequence[typing.Coroutine[typing.Any, typing.Any, typing.Any]],
+) -> list[typing.Any]:
+    """Await coroutines concurrently, the pending ones are cancelled as soon as one of them fails."""
+    if len(coroutines) == 1:
+        return [await coroutines[0]]
+
+    tasks = [asyncio.ensure_future(coroutine) for coroutine in coroutines]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+class _OverrideContext:
+    __slots__ = "_provider", "_mock", "_previous"
+
+    def __init__(self, provider: AbstractProvider[typing.Any], mock: object) -> None:
+        self._provider: typing.Final = provider
+        self._mock: typing.Final = mock
+        self._previous: typing.Any = None
+
+    def __call__(self, func: typing.Callable[P, R]) -> typing.Callable[P, R]:
+        # every call enters its own context, so recursive and concurrent calls restore their own previous mock
+        @functools.wraps(func)
+        def inner(*args: P.args, **kwargs: P.kwargs) -> R:
+            with _OverrideContext(self._provider, self._mock):
+                return func(*args, **kwargs)
+
+        return inner
+
+    def __enter__(self) -> None:
+        # nested override contexts restore the outer mock on exit
+        self._previous = self._provider._override  # noqa: SLF001
+        self._provider.override(self._mock)
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        if self._previous is None:
+            self._provider.reset_override()
+        else:
+            self._provider.override(self._previous)
+
+
+class ResolvableArguments:
+    """Arguments of a provider, where dependencies are resolved on every call."""
+
+    __slots__ = "_args", "_kwargs", "_provider_args", "_provider_kwargs"
+
+    def __init__(self, args: tuple[typing.Any, ...], kwargs: dict[str, typing.Any]) -> None:
+        self._args: typing.Final = args
+        self._kwargs: typing.Final = kwargs
+        # positions and keys of dependencies with their bound resolvers, the rest of the arguments are passed as is
+        self._provider_args: typing.Final = tuple(
+            (i, arg.async_resolve, arg.sync_resolve, arg.is_async)
+            for i, arg in enumerate(args)
+            if isinstance(arg, AbstractProvider)
+        )
+        self._provider_kwargs: typing.Final = tuple(
+            (key, value.async_resolve, value.sync_resolve, value.is_async)
+            for key, value in kwargs.items()
+            if isinstance(value, AbstractProvider)
+        )
+
+    async def async_resolve(self) -> tuple[typing.Sequence[typing.Any], typing.Mapping[str, typing.Any]]:
+        # arguments without dependencies are passed as they were given
+        if not self._provider_args and not self._provider_kwargs:
+            return self._args, self._kwargs
+
+        args = list(self._args)
+        kwargs = dict(self._kwargs)
+        for i, async_resolve, _, _ in self._provider_args:
+            args[i] = await async_resolve()
+        for key, async_resolve, _, _ in self._provider_kwargs:
+            kwargs[key] = await async_resolve()
+        return args, kwargs
+
+    async def async_resolve_concurrently(self) -> tuple[typing.Sequence[typing.Any], typing.Mapping[str, typing.Any]]:
+        """Resolve dependencies of async providers concurrently, the rest are awaited directly.
+
+        Used by resources, which resolve arguments on every new context, not on every call.
+        """
+        if not self._provider_args and not self._provider_kwargs:
+            return self._args, self._kwargs
+
+        args = list(self._args)
+        kwargs = dict(self._kwargs)
+        async_args: list[tuple[int, typing.Callable[[], typing.Coroutine[typing.Any, typing.Any, typing.Any]]]] = []
+        async_kwargs: list[tuple[str, typing.Callable[[], typing.Coroutine[typing.Any, typing.Any, typing.Any]]]] = []
+        for i, async_resolve, _, is_async in self._provider_args:
+            if is_async:
+                async_args.append((i, async_resolve))
+            else:
+                args[i] = await async_resolve()
+        for key, async_resolve, _, is_async in self._provider_kwargs:
+            if is_async:
+                async_kwargs.append((key, async_resolve))
+            else:
+                kwargs[key] = await async_resolve()
+
+        if async_args or async_kwargs:
+            values = await resolve_concurrently([async_resolve() for _, async_resolve in (*async_args, *async_kwargs)])
+            for (i, _), value in zip(async_args, values[: len(async_args)], strict=True):
+                args[i] = value
+            for (key, _), value in zip(async_kwargs, values[len(async_args) :], strict=True):
+                kwargs[key] = value
+        return args, kwargs
+
+    def sync_resolve(self) -> tuple[typing.Sequence[typing.Any], typing.Mapping[str, typing.Any]]:
+        if not self._provider_args and not self._provider_kwargs:
+            return self._args, self._kwargs
+
+        args = list(self._args)
+        kwargs = dict(self._kwargs)
+        for i, _, sync_resolve, _ in self._provider_args:
+            args[i] = sync_resolve()
+        for key, _, sync_resolve, _ in self._provider_kwargs:
+            kwargs[key] = sync_resolve()
+        return args, kwargs
+
+
+class EventLoopLock:
+    """Lock for the running event loop, created on first use and recreated when the loop changes."""
+
+    __slots__ = "_lock", "_loop"
+
+    def __init__(self) -> None:
+        self._lock: asyncio.Lock | None = None
+        self._loop: weakref.ref[asyncio.AbstractEventLoop] | None = None
+
+    def get(self) -> asyncio.Lock:
+        # a lock bound to another event loop cannot be awaited
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._loop is None or self._loop() is not loop:
+            self._lock = asyncio.Lock()
+            self._loop = weakref.ref(loop)
+        return self._lock
+
+
 class ResourceContext(typing.Generic[T_co]):
-    __slots__ = "context_stack", "instance", "resolving_lock", "is_async"
+    __slots__ = "context_stack", "instance", "_resolving_lock", "is_async"
 
     def __init__(self, is_async: bool) -> None:
         """Create a new ResourceContext instance.
@@ -73,21 +220,26 @@ class ResourceContext(typing.Generic[T_co]):
         :type is_async: bool
         """
         self.instance: T_co | None = None
-        self.resolving_lock: typing.Final = asyncio.Lock()
-        self.context_stack: contextlib.AsyncExitStack | contextlib.ExitStack | None = None
+        self._resolving_lock: typing.Final = EventLoopLock()
+        # entered context manager of the resource, exited on tear down
+        self.context_stack: ContextStack | None = None
         self.is_async = is_async
 
+    @property
+    def resolving_lock(self) -> asyncio.Lock:
+        return self._resolving_lock.get()
+
     @staticmethod
     def is_context_stack_async(
-        context_stack: contextlib.AsyncExitStack | contextlib.ExitStack | None,
-    ) -> typing.TypeGuard[contextlib.AsyncExitStack]:
-        return isinstance(context_stack, contextlib.AsyncExitStack)
+        context_stack: ContextStack | None,
+    ) -> typing.TypeGuard[contextlib.AbstractAsyncContextManager[typing.Any]]:
+        return isinstance(context_stack, contextlib.AbstractAsyncContextManager)
 
     @staticmethod
     def is_context_stack_sync(
-        context_stack: contextlib.AsyncExitStack | contextlib.ExitStack,
-    ) -> typing.TypeGuard[contextlib.ExitStack]:
-        return isinstance(context_stack, contextlib.ExitStack)
+        context_stack: ContextStack,
+    ) -> typing.TypeGuard[contextlib.AbstractContextManager[typing.Any]]:
+        return isinstance(context_stack, contextlib.AbstractContextManager)
 
     async def tear_down(self) -> None:
         """Async tear down the context stack."""
@@ -95,9 +247,9 @@ class ResourceContext(typing.Generic[T_co]):
             return
 
         if self.is_context_stack_async(self.context_stack):
-            await self.context_stack.aclose()
+            await self.context_stack.__aexit__(None, None, None)
         elif self.is_context_stack_sync(self.context_stack):
-            self.context_stack.close()
+            self.context_stack.__exit__(None, None, None)
         self.context_stack = None
         self.instance = None
 
@@ -110,7 +262,7 @@ class ResourceContext(typing.Generic[T_co]):
             return
 
         if self.is_context_stack_sync(self.context_stack):
-            self.context_stack.close()
+            self.context_stack.__exit__(None, None, None)
             self.context_stack = None
             self.instance = None
         elif self.is_context_stack_async(self.context_stack):
@@ -119,6 +271,8 @@ class ResourceContext(typing.Generic[T_co]):
 
 
 class AbstractResource(AbstractProvider[T_co], abc.ABC):
+    __slots__ = "_is_async", "_arguments", "_async_context_manager", "_sync_context_manager"
+
     def __init__(
         self,
         creator: typing.Callable[P, typing.Iterator[T_co] | typing.AsyncIterator[T_co]],
@@ -126,34 +280,27 @@ class AbstractResource(AbstractProvider[T_co], abc.ABC):
         **kwargs: P.kwargs,
     ) -> None:
         super().__init__()
+        # generator is wrapped into context manager factory once, not on every resolve
+        self._async_context_manager: typing.Callable[P, contextlib.AbstractAsyncContextManager[T_co]] | None = None
+        self._sync_context_manager: typing.Callable[P, contextlib.AbstractContextManager[T_co]] | None = None
         if inspect.isasyncgenfunction(creator):
             self._is_async = True
+            self._async_context_manager = contextlib.asynccontextmanager(creator)
         elif inspect.isgeneratorfunction(creator):
             self._is_async = False
+            self._sync_context_manager = contextlib.contextmanager(creator)
         else:
             msg = f"{type(self).__name__} must be generator function"
             raise RuntimeError(msg)
 
-        self._creator: typing.Final = creator
-        self._args: typing.Final = args
-        self._kwargs: typing.Final = kwargs
         self._override = None
-
-    def _is_creator_async(
-        self, _: typing.Callable[P, typing.Iterator[T_co] | typing.AsyncIterator[T_co]]
-    ) -> typing.TypeGuard[typing.Callable[P, typing.AsyncIterator[T_co]]]:
-        return self._is_async
-
-    def _is_creator_sync(
-        self, _: typing.Callable[P, typing.Iterator[T_co] | typing.AsyncIterator[T_co]]
-    ) -> typing.TypeGuard[typing.Callable[P, typing.Iterator[T_co]]]:
-        return not self._is_async
+        self._arguments: typing.Final = ResolvableArguments(args, kwargs)
 
     @abc.abstractmethod
     def _fetch_context(self) -> ResourceContext[T_co]: ...
 
     async def async_resolve(self) -> T_co:
-        if self._override:
+        if self._override is not None:
             return typing.cast(T_co, self._override)
 
         context = self._fetch_context()
@@ -161,66 +308,49 @@ class AbstractResource(AbstractProvider[T_co], abc.ABC):
         if context.instance is not None:
             return context.instance
 
-        if not context.is_async and self._is_creator_async(self._creator):
+        if not context.is_async and self._is_async:
             msg = "AsyncResource cannot be resolved in an sync context."
             raise RuntimeError(msg)
 
         # lock to prevent race condition while resolving
         async with context.resolving_lock:
             if context.instance is None:
-                if self._is_creator_async(self._creator):
-                    context.context_stack = contextlib.AsyncExitStack()
-                    context.instance = typing.cast(
-                        T_co,
-                        await context.context_stack.enter_async_context(
-                            contextlib.asynccontextmanager(self._creator)(
-                                *[await x() if isinstance(x, AbstractProvider) else x for x in self._args],
-                                **{
-                                    k: await v() if isinstance(v, AbstractProvider) else v
-                                    for k, v in self._kwargs.items()
-                                },
-                            ),
-                        ),
-                    )
-                elif self._is_creator_sync(self._creator):
-                    context.context_stack = contextlib.ExitStack()
-                    context.instance = context.context_stack.enter_context(
-                        contextlib.contextmanager(self._creator)(
-                            *[await x.async_resolve() if isinstance(x, AbstractProvider) else x for x in self._args],
-                            **{
-                                k: await v.async_resolve() if isinstance(v, AbstractProvider) else v
-                                for k, v in self._kwargs.items()
-                            },
-                        ),
-                    )
+                args, kwargs = await self._arguments.async_resolve_concurrently()
+                if self._async_context_manager is not None:
+                    async_context_manager = self._async_context_manager(*args, **kwargs)
+                    context.instance = await async_context_manager.__aenter__()
+                    context.context_stack = async_context_manager
+                elif self._sync_context_manager is not None:
+                    sync_context_manager = self._sync_context_manager(*args, **kwargs)
+                    context.instance = sync_context_manager.__enter__()
+                    context.context_stack = sync_context_manager
             return typing.cast(T_co, context.instance)
 
     def sync_resolve(self) -> T_co:
-        if self._override:
+        if self._override is not None:
             return typing.cast(T_co, self._override)
 
         context = self._fetch_context()
         if context.instance is not None:
             return context.instance
 
-        if self._is_creator_async(self._creator):
+        if self._async_context_manager is not None:
             msg = "AsyncResource cannot be resolved synchronously"
             raise RuntimeError(msg)
 
-        if self._is_creator_sync(self._creator):
-            context.context_stack = contextlib.ExitStack()
-            context.instance = context.context_stack.enter_context(
-                contextlib.contextmanager(self._creator)(
-                    *[x.sync_resolve() if isinstance(x, AbstractProvider) else x for x in self._args],
-                    **{k: v.sync_resolve() if isinstance(v, AbstractProvider) else v for k, v in self._kwargs.items()},
-                ),
-            )
+        if self._sync_context_manager is not None:
+            args, kwargs = self._arguments.sync_resolve()
+            sync_context_manager = self._sync_context_manager(*args, **kwargs)
+            context.instance = sync_context_manager.__enter__()
+            context.context_stack = sync_context_manager
         return typing.cast(T_co, context.instance)
 
 
 class AbstractFactory(AbstractProvider[T_co], abc.ABC):
     """Abstract Factory Class."""
 
+    __slots__ = ()
+
     @property
     def provider(self) -> typing.Callable[[], typing.Coroutine[typing.Any, typing.Any, T_co]]:
         return self.async_resolve
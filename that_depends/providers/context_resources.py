@@ -139,14 +139,7 @@ def fetch_context_item(key: str, default: typing.Any = None) -> typing.Any:  # n
 
 
 class ContextResource(AbstractResource[T_co]):
-    __slots__ = (
-        "_is_async",
-        "_creator",
-        "_args",
-        "_kwargs",
-        "_override",
-        "_internal_name",
-    )
+    __slots__ = ("_internal_name",)
 
     def __init__(
         self,
@@ -168,6 +161,8 @@ class ContextResource(AbstractResource[T_co]):
 
 
 class AsyncContextResource(ContextResource[T_co]):
+    __slots__ = ()
+
     def __init__(
         self,
         creator: typing.Callable[P, typing.AsyncIterator[T_co]],
@@ -1,6 +1,6 @@
 import typing
 
-from that_depends.providers.base import AbstractFactory, AbstractProvider
+from that_depends.providers.base import AbstractFactory, ResolvableArguments
 
 
 T_co = typing.TypeVar("T_co", covariant=True)
@@ -8,51 +8,44 @@ P = typing.ParamSpec("P")
 
 
 class Factory(AbstractFactory[T_co]):
-    __slots__ = "_factory", "_args", "_kwargs", "_override"
+    __slots__ = "_factory", "_arguments"
 
     def __init__(self, factory: type[T_co] | typing.Callable[P, T_co], *args: P.args, **kwargs: P.kwargs) -> None:
         super().__init__()
         self._factory: typing.Final = factory
-        self._args: typing.Final = args
-        self._kwargs: typing.Final = kwargs
         self._override = None
+        self._arguments: typing.Final = ResolvableArguments(args, kwargs)
 
     async def async_resolve(self) -> T_co:
-        if self._override:
+        if self._override is not None:
             return typing.cast(T_co, self._override)
 
-        return self._factory(
-            *[await x.async_resolve() if isinstance(x, AbstractProvider) else x for x in self._args],
-            **{k: await v.async_resolve() if isinstance(v, AbstractProvider) else v for k, v in self._kwargs.items()},
-        )
+        args, kwargs = await self._arguments.async_resolve()
+        return self._factory(*args, **kwargs)
 
     def sync_resolve(self) -> T_co:
-        if self._override:
+        if self._override is not None:
             return typing.cast(T_co, self._override)
 
-        return self._factory(
-            *[x.sync_resolve() if isinstance(x, AbstractProvider) else x for x in self._args],
-            **{k: v.sync_resolve() if isinstance(v, AbstractProvider) else v for k, v in self._kwargs.items()},
-        )
+        args, kwargs = self._arguments.sync_resolve()
+        return self._factory(*args, **kwargs)
 
 
 class AsyncFactory(AbstractFactory[T_co]):
-    __slots__ = "_factory", "_args", "_kwargs", "_override"
+    __slots__ = "_factory", "_arguments"
+    is_async = True
 
     def __init__(self, factory: typing.Callable[P, typing.Awaitable[T_co]], *args: P.args, **kwargs: P.kwargs) -> None:
         self._factory: typing.Final = factory
-        self._args: typing.Final = args
-        self._kwargs: typing.Final = kwargs
         self._override = None
+        self._arguments: typing.Final = ResolvableArguments(args, kwargs)
 
     async def async_resolve(self) -> T_co:
-        if self._override:
+        if self._override is not None:
             return typing.cast(T_co, self._override)
 
-        return await self._factory(
-            *[await x.async_resolve() if isinstance(x, AbstractProvider) else x for x in self._args],
-            **{k: await v.async_resolve() if isinstance(v, AbstractProvider) else v for k, v in self._kwargs.items()},
-        )
+        args, kwargs = await self._arguments.async_resolve()
+        return await self._factory(*args, **kwargs)
 
     def sync_resolve(self) -> typing.NoReturn:
         msg = "AsyncFactory cannot be resolved synchronously"
@@ -9,14 +9,7 @@ P = typing.ParamSpec("P")
 
 
 class Resource(AbstractResource[T_co]):
-    __slots__ = (
-        "_is_async",
-        "_creator",
-        "_args",
-        "_kwargs",
-        "_override",
-        "_context",
-    )
+    __slots__ = ("_context",)
 
     def __init__(
         self,
@@ -35,6 +28,8 @@ class Resource(AbstractResource[T_co]):
 
 
 class AsyncResource(Resource[T_co]):
+    __slots__ = ()
+
     def __init__(
         self,
         creator: typing.Callable[P, typing.AsyncIterator[T_co]],
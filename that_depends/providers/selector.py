@@ -7,7 +7,7 @@ T_co = typing.TypeVar("T_co", covariant=True)
 
 
 class Selector(AbstractProvider[T_co]):
-    __slots__ = "_selector", "_providers", "_override"
+    __slots__ = "_selector", "_providers"
 
     def __init__(self, selector: typing.Callable[[], str], **providers: AbstractProvider[T_co]) -> None:
         super().__init__()
@@ -16,7 +16,7 @@ class Selector(AbstractProvider[T_co]):
         self._override = None
 
     async def async_resolve(self) -> T_co:
-        if self._override:
+        if self._override is not None:
             return typing.cast(T_co, self._override)
 
         selected_key: typing.Final = self._selector()
@@ -26,7 +26,7 @@ class Selector(AbstractProvider[T_co]):
         return await self._providers[selected_key].async_resolve()
 
     def sync_resolve(self) -> T_co:
-        if self._override:
+        if self._override is not None:
             return typing.cast(T_co, self._override)
 
         selected_key: typing.Final = self._selector()
@@ -1,8 +1,7 @@
-import asyncio
 import typing
 
-from that_depends.providers import AttrGetter
-from that_depends.providers.base import AbstractProvider
+from that_depends.providers.attr_getter import AttrGetter
+from that_depends.providers.base import AbstractProvider, EventLoopLock
 
 
 T_co = typing.TypeVar("T_co", covariant=True)
@@ -10,7 +9,7 @@ P = typing.ParamSpec("P")
 
 
 class Singleton(AbstractProvider[T_co]):
-    __slots__ = "_factory", "_args", "_kwargs", "_override", "_instance", "_resolving_lock"
+    __slots__ = "_factory", "_args", "_kwargs", "_instance", "_resolving_lock"
 
     def __init__(self, factory: type[T_co] | typing.Callable[P, T_co], *args: P.args, **kwargs: P.kwargs) -> None:
         super().__init__()
@@ -19,10 +18,10 @@ class Singleton(AbstractProvider[T_co]):
         self._kwargs: typing.Final = kwargs
         self._override = None
         self._instance: T_co | None = None
-        self._resolving_lock: typing.Final = asyncio.Lock()
+        self._resolving_lock: typing.Final = EventLoopLock()
 
     def __getattr__(self, attr_name: str) -> typing.Any:  # noqa: ANN401
-        if attr_name.startswith("_"):
+        if attr_name[:1] == "_":
             msg = f"'{type(self)}' object has no attribute '{attr_name}'"
             raise AttributeError(msg)
         return AttrGetter(provider=self, attr_name=attr_name)
@@ -35,7 +34,7 @@ class Singleton(AbstractProvider[T_co]):
             return self._instance
 
         # lock to prevent resolving several times
-        async with self._resolving_lock:
+        async with self._resolving_lock.get():
             if self._instance is None:
                 self._instance = self._factory(
                     *[await x.async_resolve() if isinstance(x, AbstractProvider) else x for x in self._args],